@@ -8,6 +8,7 @@ from app.schemas.user_dto import (
     UserResponse,
     UserUpdateDTO,
     UserExportData,
+    UserDataSummary,
     AccountDeletionRequest,
 )
 from app.schemas.auth_dto import (
@@ -403,7 +404,7 @@ async def anonymize_user_account(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/data-summary")
+@router.get("/data-summary", response_model=UserDataSummary)
 async def get_user_data_summary(
     current_user: UserResponse = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -416,7 +417,7 @@ async def get_user_data_summary(
         db (Session): Database session
 
     Returns:
-        dict: Data summary
+        UserDataSummary: Data summary
     """
     from app.services.wallet_service import WalletService
     from app.repositories.transaction_repository import TransactionRepository
@@ -432,10 +433,7 @@ async def get_user_data_summary(
     wallet_summary = wallet_service.get_wallet_summary(current_user.id)
 
     # Get actual counts from repositories
-    transactions_response = transaction_repo.get_user_transactions(
-        current_user.id, limit=1
-    )
-    transactions_count = transactions_response.total
+    transactions_count = transaction_repo.count_user_transactions(current_user.id)
 
     debts_count = debt_repo.count_user_debts(current_user.id)
 
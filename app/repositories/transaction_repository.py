@@ -158,6 +158,16 @@ class TransactionRepository:
             total_pages=total_pages,
         )
 
+    def count_user_transactions(
+        self, user_id: int, filters: Optional[TransactionFilterDTO] = None
+    ) -> int:
+        """Count total transactions for a user with optional filtering"""
+        query = (
+            self.db.query(Transaction).join(Wallet).filter(Wallet.user_id == user_id)
+        )
+        query = self._apply_transaction_filters(query, filters)
+        return query.count()
+
     def _apply_transaction_filters(
         self, query, filters: Optional[TransactionFilterDTO]
     ):
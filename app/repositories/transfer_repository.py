@@ -223,7 +223,8 @@ class TransferRepository:
             if filters.date_to:
                 query = query.filter(Transfer.created_at <= filters.date_to)
 
-        return query.count()
+        # A transfer between two of the user's wallets joins twice
+        return query.distinct().count()
 
     def get_wallet_transfers(self, wallet_id: int, user_id: int) -> List[Transfer]:
         """Get all transfers for a specific wallet (both sent and received)"""
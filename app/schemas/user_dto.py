@@ -39,3 +39,15 @@ class UserExportData(BaseModel):
     transfers: list = []  # Will be populated with transfer data
     export_timestamp: datetime
     data_retention_period: str
+
+
+class UserDataSummary(BaseModel):
+    user_id: int
+    email: str
+    account_created: datetime
+    wallets_count: int
+    transactions_count: int
+    debts_count: int
+    transfers_count: int
+    total_balance: float  # Sent as a JSON number, not a Decimal string
+    data_summary_generated_at: datetime
@@ -3,14 +3,16 @@
 Category seeder module for creating default categories.
 """
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.db.models.user import User
 from app.db.models.category import Category
-from typing import List, Dict, Optional
+from typing import Dict, Optional, Sequence, Tuple
 
 
-# Default categories with their metadata
-DEFAULT_CATEGORIES = [
+# Default categories with their metadata. A tuple, so callers can share it
+# without a defensive copy.
+DEFAULT_CATEGORIES = (
     # Income Categories
     {"name": "Salary", "color": "#28a745", "icon": "money"},
     {"name": "Freelance", "color": "#17a2b8", "icon": "laptop"},
@@ -57,7 +59,7 @@ DEFAULT_CATEGORIES = [
     {"name": "Subscriptions", "color": "#6c757d", "icon": "subscription"},
     {"name": "Taxes", "color": "#dc3545", "icon": "receipt"},
     {"name": "Other Expenses", "color": "#6c757d", "icon": "minus"},
-]
+)
 
 
 class CategorySeeder:
@@ -69,7 +71,7 @@ class CategorySeeder:
     def seed_for_user(
         self,
         user_id: int,
-        categories_data: Optional[List[Dict]] = None,
+        categories_data: Optional[Sequence[Dict]] = None,
         skip_existing: bool = True,
     ) -> int:
         """
@@ -86,35 +88,37 @@ class CategorySeeder:
         if categories_data is None:
             categories_data = DEFAULT_CATEGORIES
 
-        created_count = 0
-
-        for cat_data in categories_data:
-            if skip_existing:
-                # Check if category already exists for this user
-                existing = (
-                    self.db.query(Category)
-                    .filter(
-                        Category.user_id == user_id, Category.name == cat_data["name"]
-                    )
-                    .first()
+        existing_names = set()
+        if skip_existing:
+            # Fetch the user's existing category names in a single query
+            existing_names = {
+                name
+                for (name,) in self.db.query(Category.name).filter(
+                    Category.user_id == user_id
                 )
+            }
 
-                if existing:
-                    continue
+        rows = [
+            {
+                "name": cat_data["name"],
+                "color": cat_data.get("color"),
+                "icon": cat_data.get("icon"),
+                "user_id": user_id,
+            }
+            for cat_data in categories_data
+            if cat_data["name"] not in existing_names
+        ]
 
-            category = Category(
-                name=cat_data["name"],
-                color=cat_data.get("color"),
-                icon=cat_data.get("icon"),
-                user_id=user_id,
-            )
-            self.db.add(category)
-            created_count += 1
+        # One executemany INSERT instead of a round trip per category
+        if rows:
+            self.db.execute(insert(Category), rows)
 
-        return created_count
+        return len(rows)
 
     def seed_for_all_users(
-        self, categories_data: Optional[List[Dict]] = None, skip_existing: bool = True
+        self,
+        categories_data: Optional[Sequence[Dict]] = None,
+        skip_existing: bool = True,
     ) -> Dict[str, int]:
         """
         Seed categories for all existing users
@@ -145,7 +149,7 @@ class CategorySeeder:
     def seed_for_user_by_email(
         self,
         email: str,
-        categories_data: Optional[List[Dict]] = None,
+        categories_data: Optional[Sequence[Dict]] = None,
         skip_existing: bool = True,
     ) -> Optional[int]:
         """
@@ -170,9 +174,9 @@ class CategorySeeder:
         """Get the number of categories for a user"""
         return self.db.query(Category).filter(Category.user_id == user_id).count()
 
-    def get_default_categories(self) -> List[Dict]:
-        """Get the list of default categories"""
-        return DEFAULT_CATEGORIES.copy()
+    def get_default_categories(self) -> Tuple[Dict, ...]:
+        """Get the default categories"""
+        return DEFAULT_CATEGORIES
 
     def commit(self):
         """Commit the database transaction"""
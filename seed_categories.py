@@ -5,106 +5,238 @@ Category seeder script.
 Seeds the database with default categories for all users.
 """
 
+import logging
 import os
 import sys
-from sqlalchemy import create_engine
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from sqlalchemy import create_engine, insert
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 from app.db.models.user import User
 from app.db.models.category import Category
 
+logger = logging.getLogger(__name__)
 
-# Default categories with their metadata
-DEFAULT_CATEGORIES = [
+# Number of users seeded concurrently, each worker using its own connection
+SEED_WORKERS = 8
+
+# Emit one progress line per this many users instead of lines per user
+PROGRESS_EVERY = 100
+
+# Default categories, stored as parallel tuples (name, color, icon)
+CATEGORY_NAMES = (
+    # Income Categories
+    "Salary",
+    "Freelance",
+    "Investment Returns",
+    "Rental Income",
+    "Business Income",
+    "Bonus",
+    "Side Hustle",
+    "Gifts Received",
+    "Refunds",
+    "Other Income",
+    # Expense Categories - Essential
+    "Groceries",
+    "Rent/Mortgage",
+    "Utilities",
+    "Internet & Phone",
+    "Insurance",
+    "Healthcare",
+    "Transportation",
+    "Gas & Fuel",
+    # Expense Categories - Lifestyle
+    "Dining Out",
+    "Entertainment",
+    "Shopping",
+    "Clothing",
+    "Personal Care",
+    "Gym & Fitness",
+    "Hobbies",
+    "Books & Learning",
+    # Expense Categories - Financial
+    "Savings",
+    "Investments",
+    "Debt Payment",
+    "Emergency Fund",
+    "Retirement",
+    # Expense Categories - Occasional
+    "Travel",
+    "Vacation",
+    "Gifts Given",
+    "Charity",
+    "Education",
+    "Home Improvement",
+    "Pet Care",
+    "Subscriptions",
+    "Taxes",
+    "Other Expenses",
+)
+
+CATEGORY_COLORS = (
+    # Income Categories
+    "#28a745",
+    "#17a2b8",
+    "#6f42c1",
+    "#fd7e14",
+    "#20c997",
+    "#ffc107",
+    "#e83e8c",
+    "#6610f2",
+    "#198754",
+    "#6c757d",
+    # Expense Categories - Essential
+    "#dc3545",
+    "#fd7e14",
+    "#20c997",
+    "#0dcaf0",
+    "#6610f2",
+    "#dc3545",
+    "#198754",
+    "#ffc107",
+    # Expense Categories - Lifestyle
+    "#e83e8c",
+    "#6f42c1",
+    "#fd7e14",
+    "#20c997",
+    "#0dcaf0",
+    "#198754",
+    "#6610f2",
+    "#17a2b8",
+    # Expense Categories - Financial
+    "#28a745",
+    "#6f42c1",
+    "#dc3545",
+    "#ffc107",
+    "#6c757d",
+    # Expense Categories - Occasional
+    "#17a2b8",
+    "#20c997",
+    "#e83e8c",
+    "#28a745",
+    "#6610f2",
+    "#fd7e14",
+    "#ffc107",
+    "#6c757d",
+    "#dc3545",
+    "#6c757d",
+)
+
+CATEGORY_ICONS = (
     # Income Categories
-    {"name": "Salary", "color": "#28a745", "icon": "money"},
-    {"name": "Freelance", "color": "#17a2b8", "icon": "laptop"},
-    {"name": "Investment Returns", "color": "#6f42c1", "icon": "trending-up"},
-    {"name": "Rental Income", "color": "#fd7e14", "icon": "home"},
-    {"name": "Business Income", "color": "#20c997", "icon": "briefcase"},
-    {"name": "Bonus", "color": "#ffc107", "icon": "gift"},
-    {"name": "Side Hustle", "color": "#e83e8c", "icon": "rocket"},
-    {"name": "Gifts Received", "color": "#6610f2", "icon": "gift-box"},
-    {"name": "Refunds", "color": "#198754", "icon": "return"},
-    {"name": "Other Income", "color": "#6c757d", "icon": "plus"},
+    "money",
+    "laptop",
+    "trending-up",
+    "home",
+    "briefcase",
+    "gift",
+    "rocket",
+    "gift-box",
+    "return",
+    "plus",
     # Expense Categories - Essential
-    {"name": "Groceries", "color": "#dc3545", "icon": "shopping-cart"},
-    {"name": "Rent/Mortgage", "color": "#fd7e14", "icon": "home"},
-    {"name": "Utilities", "color": "#20c997", "icon": "lightning"},
-    {"name": "Internet & Phone", "color": "#0dcaf0", "icon": "phone"},
-    {"name": "Insurance", "color": "#6610f2", "icon": "shield"},
-    {"name": "Healthcare", "color": "#dc3545", "icon": "medical"},
-    {"name": "Transportation", "color": "#198754", "icon": "car"},
-    {"name": "Gas & Fuel", "color": "#ffc107", "icon": "fuel"},
+    "shopping-cart",
+    "home",
+    "lightning",
+    "phone",
+    "shield",
+    "medical",
+    "car",
+    "fuel",
     # Expense Categories - Lifestyle
-    {"name": "Dining Out", "color": "#e83e8c", "icon": "restaurant"},
-    {"name": "Entertainment", "color": "#6f42c1", "icon": "movie"},
-    {"name": "Shopping", "color": "#fd7e14", "icon": "shopping-bag"},
-    {"name": "Clothing", "color": "#20c997", "icon": "shirt"},
-    {"name": "Personal Care", "color": "#0dcaf0", "icon": "spa"},
-    {"name": "Gym & Fitness", "color": "#198754", "icon": "fitness"},
-    {"name": "Hobbies", "color": "#6610f2", "icon": "palette"},
-    {"name": "Books & Learning", "color": "#17a2b8", "icon": "book"},
+    "restaurant",
+    "movie",
+    "shopping-bag",
+    "shirt",
+    "spa",
+    "fitness",
+    "palette",
+    "book",
     # Expense Categories - Financial
-    {"name": "Savings", "color": "#28a745", "icon": "piggy-bank"},
-    {"name": "Investments", "color": "#6f42c1", "icon": "chart"},
-    {"name": "Debt Payment", "color": "#dc3545", "icon": "credit-card"},
-    {"name": "Emergency Fund", "color": "#ffc107", "icon": "alert"},
-    {"name": "Retirement", "color": "#6c757d", "icon": "retirement"},
+    "piggy-bank",
+    "chart",
+    "credit-card",
+    "alert",
+    "retirement",
     # Expense Categories - Occasional
-    {"name": "Travel", "color": "#17a2b8", "icon": "plane"},
-    {"name": "Vacation", "color": "#20c997", "icon": "beach"},
-    {"name": "Gifts Given", "color": "#e83e8c", "icon": "gift"},
-    {"name": "Charity", "color": "#28a745", "icon": "heart"},
-    {"name": "Education", "color": "#6610f2", "icon": "graduation"},
-    {"name": "Home Improvement", "color": "#fd7e14", "icon": "hammer"},
-    {"name": "Pet Care", "color": "#ffc107", "icon": "pet"},
-    {"name": "Subscriptions", "color": "#6c757d", "icon": "subscription"},
-    {"name": "Taxes", "color": "#dc3545", "icon": "receipt"},
-    {"name": "Other Expenses", "color": "#6c757d", "icon": "minus"},
-]
+    "plane",
+    "beach",
+    "gift",
+    "heart",
+    "graduation",
+    "hammer",
+    "pet",
+    "subscription",
+    "receipt",
+    "minus",
+)
+
+
+@lru_cache(maxsize=None)
+def get_engine():
+    """Create the database engine once and share its connection pool"""
+    return create_engine(settings.DATABASE_URL, pool_size=SEED_WORKERS)
+
+
+@lru_cache(maxsize=None)
+def _get_session_factory():
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
 
 
 def get_db_session():
     """Create database session"""
-    engine = create_engine(settings.DATABASE_URL)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    return SessionLocal()
+    return _get_session_factory()()
 
 
-def seed_categories_for_user(db, user_id: int, categories_data: list) -> int:
+def seed_categories_for_user(db, user_id: int, has_categories: bool = True) -> int:
     """
-    Seed categories for a specific user
+    Seed the default categories for a specific user
 
     Args:
         db: Database session
         user_id: User ID to create categories for
-        categories_data: List of category data dictionaries
+        has_categories: Whether the user may already own categories. Pass
+            False for users known to have none to skip the existence query.
 
     Returns:
         Number of categories created
     """
-    created_count = 0
-
-    for cat_data in categories_data:
-        # Check if category already exists for this user
-        existing = (
-            db.query(Category)
-            .filter(Category.user_id == user_id, Category.name == cat_data["name"])
-            .first()
-        )
+    # Fetch the user's existing category names in a single query
+    existing_names = set()
+    if has_categories:
+        existing_names = {
+            name
+            for (name,) in db.query(Category.name).filter(Category.user_id == user_id)
+        }
+
+    rows = [
+        {"name": n, "color": c, "icon": i, "user_id": user_id}
+        for n, c, i in zip(CATEGORY_NAMES, CATEGORY_COLORS, CATEGORY_ICONS)
+        if n not in existing_names
+    ]
 
-        if not existing:
-            category = Category(
-                name=cat_data["name"],
-                color=cat_data["color"],
-                icon=cat_data["icon"],
-                user_id=user_id,
-            )
-            db.add(category)
-            created_count += 1
+    if rows:
+        db.execute(insert(Category), rows)
 
-    return created_count
+    return len(rows)
+
+
+def _seed_user_in_own_session(user_id: int, has_categories: bool) -> int:
+    """Seed and commit one user's categories in a dedicated session"""
+    db = get_db_session()
+
+    try:
+        created_count = seed_categories_for_user(db, user_id, has_categories)
+        db.commit()
+        return created_count
+
+    except Exception:
+        db.rollback()
+        raise
+
+    finally:
+        db.close()
 
 
 def seed_categories_for_all_users():
@@ -113,7 +245,7 @@ def seed_categories_for_all_users():
 
     try:
         # Get all users
-        users = db.query(User).all()
+        users = db.query(User.id, User.name, User.email).all()
 
         if not users:
             print("No users found in the database. Please create users first.")
@@ -121,23 +253,50 @@ def seed_categories_for_all_users():
 
         print(f"Found {len(users)} users in the database")
 
-        total_created = 0
-
-        for user in users:
-            print(f"\nSeeding categories for user: {user.name} ({user.email})")
-
-            created_count = seed_categories_for_user(db, user.id, DEFAULT_CATEGORIES)
-            total_created += created_count
+        # One query tells us which users already own categories; fresh users
+        # can then be bulk inserted without a per-user existence check
+        seeded_user_ids = {
+            user_id for (user_id,) in db.query(Category.user_id).distinct()
+        }
 
-            print(f"   Created {created_count} categories")
-
-        # Commit all changes
-        db.commit()
+        # Users are independent, so overlap their database round trips
+        total_created = 0
+        with ThreadPoolExecutor(max_workers=SEED_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    _seed_user_in_own_session, user.id, user.id in seeded_user_ids
+                ): user
+                for user in users
+            }
+
+            # Report progress as users finish, not after the whole pool drains
+            for index, future in enumerate(as_completed(futures), start=1):
+                user = futures[future]
+                try:
+                    created_count = future.result()
+                except Exception:
+                    # Stop seeding users that have not started yet
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    print(
+                        f"Seeding stopped: {index - 1}/{len(users)} users were "
+                        "already committed and keep their categories (users still "
+                        "in progress may finish too). Re-run to seed the rest."
+                    )
+                    raise
+                total_created += created_count
+                logger.debug(
+                    "Created %d categories for user: %s (%s)",
+                    created_count,
+                    user.name,
+                    user.email,
+                )
+                if index % PROGRESS_EVERY == 0:
+                    logger.info("Processed %d/%d users", index, len(users))
 
         print(
             f"\nSuccessfully created {total_created} total categories across all users!"
         )
-        print(f"Default categories available: {len(DEFAULT_CATEGORIES)}")
+        print(f"Default categories available: {len(CATEGORY_NAMES)}")
 
         return True
 
@@ -164,13 +323,13 @@ def seed_categories_for_specific_user(user_email: str):
 
         print(f"Seeding categories for user: {user.name} ({user.email})")
 
-        created_count = seed_categories_for_user(db, user.id, DEFAULT_CATEGORIES)
+        created_count = seed_categories_for_user(db, user.id)
 
         # Commit changes
         db.commit()
 
         print(f"Created {created_count} categories for {user.name}")
-        print(f"Default categories available: {len(DEFAULT_CATEGORIES)}")
+        print(f"Default categories available: {len(CATEGORY_NAMES)}")
 
         return True
 
@@ -188,11 +347,12 @@ def list_available_categories():
     print("Available Default Categories:")
     print("=" * 50)
 
+    categories = list(zip(CATEGORY_NAMES, CATEGORY_COLORS, CATEGORY_ICONS))
     income_cats = [
         cat
-        for cat in DEFAULT_CATEGORIES
+        for cat in categories
         if any(
-            word in cat["name"].lower()
+            word in cat[0].lower()
             for word in [
                 "salary",
                 "freelance",
@@ -209,16 +369,16 @@ def list_available_categories():
     ]
 
     print("\nIncome Categories:")
-    for cat in income_cats:
-        print(f"   {cat['icon']} {cat['name']} ({cat['color']})")
+    for name, color, icon in income_cats:
+        print(f"   {icon} {name} ({color})")
 
-    expense_cats = [cat for cat in DEFAULT_CATEGORIES if cat not in income_cats]
+    expense_cats = [cat for cat in categories if cat not in income_cats]
 
     print("\nExpense Categories:")
-    for cat in expense_cats:
-        print(f"   {cat['icon']} {cat['name']} ({cat['color']})")
+    for name, color, icon in expense_cats:
+        print(f"   {icon} {name} ({color})")
 
-    print(f"\nTotal Categories: {len(DEFAULT_CATEGORIES)}")
+    print(f"\nTotal Categories: {len(CATEGORY_NAMES)}")
 
 
 def main():
@@ -238,6 +398,8 @@ def main():
         print("  python seed_categories.py list")
         return
 
+    logging.basicConfig(stream=sys.stdout, level=logging.INFO, format="%(message)s")
+
     command = sys.argv[1].lower()
 
     if command == "list":
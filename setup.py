@@ -87,13 +87,16 @@ def test_database_connection():
     """Test database connection"""
     print("🔄 Testing database connection...")
     try:
-        # Try to import and test database connection
+        # Imported lazily: dependencies may have only just been installed
         from app.core.config import settings
         from sqlalchemy import create_engine, text
 
         engine = create_engine(settings.DATABASE_URL)
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        finally:
+            engine.dispose()
 
         print("✅ Database connection successful")
         return True
@@ -114,13 +117,10 @@ def run_tests():
     """Run test scripts"""
     print("\n🧪 Running Tests...")
 
-    if not run_command("python test_auth_flow.py", "Testing authentication flow"):
-        return False
-
-    if not run_command("python tests/test_wallet_flow.py", "Testing wallet management"):
-        return False
-
-    return True
+    return run_command(
+        "python -m pytest -q tests/test_auth.py tests/test_wallets.py",
+        "Testing authentication and wallet management",
+    )
 
 
 def main():
@@ -156,7 +156,7 @@ def main():
     print("1. Review and update the .env file with your actual database credentials")
     print("2. Start the API server: uvicorn app.main:app --reload")
     print("3. Visit http://localhost:8000/docs for API documentation")
-    print("4. Run tests: python test_auth_flow.py && python tests/test_wallet_flow.py")
+    print("4. Run tests: pytest tests/test_auth.py tests/test_wallets.py")
 
     # Ask if user wants to run tests
     if (
@@ -1,23 +1,42 @@
 import pytest
 import os
+import secrets
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from httpx import ASGITransport, AsyncClient
+from jose import jwt
+from sqlalchemy import create_engine, event, insert
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
 # Force use of test settings
 os.environ["APP_ENV"] = "test"
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
 
 # Import necessary modules
 from app.db.base import Base, get_db
 from app.main import app
 from app.core.config import settings
-from app.core.security import create_access_token, hash_password
+from app.core.security import (
+    create_access_token,
+    create_refresh_token,
+    hash_password,
+    pwd_context,
+)
 from app.db.models.user import User
 from app.db.models.refresh_token import RefreshToken
 from app.db.models.wallet import Wallet
+from tests.utils.data_seeder import (
+    DataSeeder,
+    apply_balance_deltas,
+    commit_staged_rows,
+    stage_rows,
+)
 
-# Create in-memory SQLite database for tests
+# Create in-memory SQLite database for tests. StaticPool keeps its single
+# connection private to the process, so each pytest-xdist worker already
+# gets its own database.
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
 
 engine = create_engine(
@@ -28,18 +47,60 @@ engine = create_engine(
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-@pytest.fixture(scope="function")
-def db():
-    """Database session fixture"""
-    # Create tables
+@event.listens_for(engine, "connect")
+def _sqlite_pragmas(dbapi_connection, connection_record):
+    # Durability settings are pointless for an in-memory database
+    cursor = dbapi_connection.cursor()
+    for pragma in (
+        "synchronous=OFF",
+        "journal_mode=MEMORY",
+        "temp_store=MEMORY",
+        "foreign_keys=ON",
+    ):
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+
+# pysqlite does not emit BEGIN itself, which breaks SAVEPOINT handling.
+# Let SQLAlchemy own the transaction boundaries instead.
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """Create the schema once for the whole test session"""
     Base.metadata.create_all(bind=engine)
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+
 
-    # Create a db session
-    db_session = TestingSessionLocal()
+@pytest.fixture(scope="function")
+def db(db_engine):
+    """
+    Database session fixture.
+    Each test runs inside an outer transaction that is rolled back on
+    teardown; commits made by the app only release a SAVEPOINT.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+
+    # Create a db session joined to the outer transaction
+    db_session = TestingSessionLocal(
+        bind=connection, join_transaction_mode="create_savepoint"
+    )
 
     # Override get_db dependency
     def override_get_db():
         try:
+            # Publish rows staged by fixtures before the app can roll back
+            commit_staged_rows(db_session)
             yield db_session
         finally:
             pass
@@ -50,81 +111,167 @@ def db():
         yield db_session
     finally:
         db_session.close()
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
         app.dependency_overrides.clear()
 
 
-@pytest.fixture(scope="function")
-def client(db):
-    """Test client fixture"""
+@pytest.fixture(scope="session")
+def _app_client():
+    """Single TestClient; app startup/shutdown runs once per session"""
     with TestClient(app) as test_client:
         yield test_client
 
 
+@pytest.fixture(scope="function")
+def client(db, _app_client):
+    """Test client fixture, routed to the per-test db session"""
+    return _app_client
+
+
+@pytest.fixture(scope="function")
+async def async_client(db):
+    """Async test client calling the ASGI app in-process, without a thread hop"""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def user_client(async_client, user_auth_session):
+    """Async test client sending the session user's token by default"""
+    async_client.headers.update(user_auth_session["headers"])
+    return async_client
+
+
 @pytest.fixture
-def test_user(db: Session) -> User:
+def query_counter(db_engine):
+    """
+    Context manager collecting the SQL statements executed inside it.
+
+    Usage: ``with query_counter() as statements: ...``
+    """
+
+    @contextmanager
+    def _count():
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db_engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(db_engine, "before_cursor_execute", _record)
+
+    return _count
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_password_hashing():
+    """
+    Store test passwords in plaintext so hashing costs nothing.
+    Set PYTEST_FAST_HASH=0 to exercise real bcrypt, at BCRYPT_ROUNDS cost.
+    """
+    if os.getenv("PYTEST_FAST_HASH", "1") == "1":
+        pwd_context.update(schemes=["plaintext"])
+
+
+@pytest.fixture(scope="session")
+def _hashed_test_pw() -> str:
+    """Hash the shared test user password once per session"""
+    return hash_password("testpassword123")
+
+
+@pytest.fixture(scope="session")
+def _hashed_admin_pw() -> str:
+    """Hash the shared admin password once per session"""
+    return hash_password("adminpassword123")
+
+
+@pytest.fixture
+def test_user(db: Session, _hashed_test_pw: str) -> User:
     """Create a test user"""
     user = User(
         name="Test User",
         email="test@example.com",
-        hashed_password=hash_password("testpassword123"),
+        hashed_password=_hashed_test_pw,
         role="user",
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    stage_rows(db)
     return user
 
 
 @pytest.fixture
-def test_admin(db: Session) -> User:
+def test_admin(db: Session, _hashed_admin_pw: str) -> User:
     """Create a test admin user"""
     admin = User(
         name="Admin User",
         email="admin@example.com",
-        hashed_password=hash_password("adminpassword123"),
+        hashed_password=_hashed_admin_pw,
         role="admin",
     )
     db.add(admin)
-    db.commit()
-    db.refresh(admin)
+    stage_rows(db)
     return admin
 
 
+# Re-sign a cached token once it is this close to expiring
+TOKEN_REFRESH_MARGIN = timedelta(seconds=30)
+
+
+def _cached_auth_headers(token_cache: dict, user: User) -> dict:
+    """Return auth headers for user, signing a new token only when needed"""
+    key = (user.email, user.role, user.id)
+    cached = token_cache.get(key)
+    now = datetime.now(timezone.utc)
+
+    if cached is None or cached["expires_at"] - now < TOKEN_REFRESH_MARGIN:
+        token = create_access_token(
+            data={"sub": user.email, "role": user.role, "user_id": user.id}
+        )
+        expires_at = datetime.fromtimestamp(
+            jwt.get_unverified_claims(token)["exp"], tz=timezone.utc
+        )
+        cached = {
+            "headers": {"Authorization": f"Bearer {token}"},
+            "expires_at": expires_at,
+        }
+        token_cache[key] = cached
+
+    return cached["headers"]
+
+
+@pytest.fixture(scope="session")
+def _token_cache() -> dict:
+    """Signed access tokens keyed by (email, role, user_id)"""
+    return {}
+
+
 @pytest.fixture
-def auth_headers(test_user: User):
+def auth_headers(test_user: User, _token_cache: dict):
     """Generate auth headers for test user"""
-    token = create_access_token(
-        data={"sub": test_user.email, "role": test_user.role, "user_id": test_user.id}
-    )
-    return {"Authorization": f"Bearer {token}"}
+    return _cached_auth_headers(_token_cache, test_user)
 
 
 @pytest.fixture
-def admin_auth_headers(test_admin: User):
+def admin_auth_headers(test_admin: User, _token_cache: dict):
     """Generate auth headers for admin user"""
-    token = create_access_token(
-        data={
-            "sub": test_admin.email,
-            "role": test_admin.role,
-            "user_id": test_admin.id,
-        }
-    )
-    return {"Authorization": f"Bearer {token}"}
+    return _cached_auth_headers(_token_cache, test_admin)
 
 
-@pytest.fixture
-def user_auth(client):
+@pytest.fixture(scope="session")
+def user_auth_session(db_engine, _app_client):
     """
-    Returns user auth data when needed.
-    Creates a new user and returns authentication data.
+    Registers one user for the whole test session and returns its auth data.
+    The user is committed outside the per-test transaction, so every test
+    starts from the same user state.
     """
-    import random
-    import string
-
     # Generate unique email
-    random_str = "".join(random.choices(string.ascii_lowercase + string.digits, k=8))
-    email = f"test_{random_str}@example.com"
+    email = f"test_{secrets.token_hex(4)}@example.com"
 
     user_payload = {
         "name": "Test User",
@@ -132,30 +279,48 @@ def user_auth(client):
         "password": "testpassword123",
     }
 
-    # Register user
-    response = client.post("/auth/register", json=user_payload)
-    assert response.status_code == 201, response.text
-    user_data = response.json()
+    session = TestingSessionLocal()
 
-    # Login to get tokens
-    form_data = {
-        "username": user_payload["email"],
-        "password": user_payload["password"],
-    }
-    response = client.post("/auth/token", data=form_data)
-    assert response.status_code == 200, response.text
-    token_data = response.json()
+    def override_get_db():
+        yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    try:
+        # Register user
+        response = _app_client.post("/auth/register", json=user_payload)
+        assert response.status_code == 201, response.text
+        user_data = response.json()
+
+        # Mint tokens in-process instead of a /auth/token round trip
+        access_token = create_access_token(
+            data={"sub": email, "role": user_data["role"], "user_id": user_data["id"]}
+        )
+        refresh_token = create_refresh_token(user_data["id"], session)
+    finally:
+        session.close()
+        app.dependency_overrides.pop(get_db, None)
 
     return {
         "user": user_data,
-        "headers": {"Authorization": f"Bearer {token_data['access_token']}"},
-        "access_token": token_data["access_token"],
-        "refresh_token": token_data["refresh_token"],
+        "headers": {"Authorization": f"Bearer {access_token}"},
+        "access_token": access_token,
+        "refresh_token": refresh_token,
         "email": email,
         "password": "testpassword123",
     }
 
 
+@pytest.fixture
+def user_auth(db, user_auth_session):
+    """
+    Returns user auth data when needed.
+    Reuses the session-wide user; the per-test rollback undoes any changes
+    a test makes to it (wallets, revoked tokens, deletion).
+    """
+    return user_auth_session
+
+
 @pytest.fixture
 def test_wallet(db: Session, test_user: User) -> Wallet:
     """Create a test wallet"""
@@ -168,8 +333,7 @@ def test_wallet(db: Session, test_user: User) -> Wallet:
         user_id=test_user.id,
     )
     db.add(wallet)
-    db.commit()
-    db.refresh(wallet)
+    stage_rows(db)
     return wallet
 
 
@@ -185,29 +349,162 @@ def multiple_wallets(db: Session, test_user: User) -> list[Wallet]:
         {"name": "Credit Card", "type": "credit", "balance": Decimal("0.00")},
     ]
 
-    wallets = []
-    for wallet_data in wallets_data:
-        wallet = Wallet(
-            name=wallet_data["name"],
-            type=wallet_data["type"],
-            balance=wallet_data["balance"],
-            user_id=test_user.id,
-        )
-        db.add(wallet)
-        wallets.append(wallet)
+    # Single executemany INSERT ... RETURNING instead of add() + refresh() per row
+    wallets = db.scalars(
+        insert(Wallet).returning(Wallet),
+        [{**wallet_data, "user_id": test_user.id} for wallet_data in wallets_data],
+    ).all()
+    stage_rows(db)
+
+    return wallets
 
-    db.commit()
-    for wallet in wallets:
-        db.refresh(wallet)
+
+@pytest.fixture
+def wallets_with_transactions(db: Session, test_user: User) -> list[Wallet]:
+    """Create 10 wallets holding 5 transactions each"""
+    from decimal import Decimal
+    from app.db.models.transaction import Transaction
+
+    wallets = db.scalars(
+        insert(Wallet).returning(Wallet),
+        [
+            {
+                "name": f"Wallet {i}",
+                "type": "checking",
+                "balance": Decimal("100.00"),
+                "user_id": test_user.id,
+            }
+            for i in range(10)
+        ],
+    ).all()
+    db.execute(
+        insert(Transaction),
+        [
+            {"type": "expense", "amount": Decimal("5.00"), "wallet_id": wallet.id}
+            for wallet in wallets
+            for _ in range(5)
+        ],
+    )
+    stage_rows(db)
 
     return wallets
 
 
 @pytest.fixture
-def test_wallet_api(client, user_auth):
+def seeder(db: Session) -> DataSeeder:
+    """DataSeeder bound to the per-test db session"""
+    return DataSeeder(db)
+
+
+@pytest.fixture
+def test_wallet_api(client, user_auth_session):
     """Create a test wallet using the API"""
     wallet_data = {"name": "Test Wallet", "type": "checking", "balance": 1000.00}
 
-    response = client.post("/wallets/", json=wallet_data, headers=user_auth["headers"])
+    response = client.post(
+        "/wallets/", json=wallet_data, headers=user_auth_session["headers"]
+    )
     assert response.status_code == 201
     return response.json()
+
+
+@pytest.fixture
+def wallet_factory(db: Session, user_auth_session):
+    """
+    Returns a callable that inserts a wallet for the session user and
+    returns its id, skipping the POST /wallets/ round trip.
+    Given several spec dicts, it inserts them all in one executemany
+    round trip and returns their ids in the same order; keyword
+    overrides then apply to every spec.
+    """
+    from decimal import Decimal
+
+    def _make(*specs: dict, **overrides):
+        defaults = {
+            "name": "Test Wallet",
+            "type": "checking",
+            "balance": Decimal("0.00"),
+            "user_id": user_auth_session["user"]["id"],
+            **overrides,
+        }
+        rows = [{**defaults, **spec} for spec in specs or ({},)]
+        ids = db.scalars(
+            insert(Wallet).returning(Wallet.id, sort_by_parameter_order=True), rows
+        ).all()
+        return ids if specs else ids[0]
+
+    return _make
+
+
+@pytest.fixture
+def transaction_factory(db: Session, test_wallet_api: dict):
+    """
+    Returns a callable that inserts a transaction on the API test wallet
+    and returns its id, skipping the POST /transactions/ round trip.
+    The wallet balance moves by the amount, as the create endpoint would.
+    """
+    from decimal import Decimal
+    from app.db.models.transaction import Transaction, TransactionType
+
+    def _make(**overrides) -> int:
+        row = {
+            "type": "expense",
+            "amount": Decimal("100.00"),
+            "category": "food",
+            "wallet_id": test_wallet_api["id"],
+            **overrides,
+        }
+        transaction_id = db.scalars(
+            insert(Transaction).returning(Transaction.id), [row]
+        ).one()
+
+        sign = 1 if row["type"] == TransactionType.INCOME else -1
+        apply_balance_deltas(db, {row["wallet_id"]: sign * Decimal(str(row["amount"]))})
+        return transaction_id
+
+    return _make
+
+
+@pytest.fixture
+def now() -> datetime:
+    """Current UTC time, read once so every value in a test shares it"""
+    return datetime.now(timezone.utc)
+
+
+@pytest.fixture
+def seeded_debts(db: Session, test_wallet_api: dict, now: datetime) -> list:
+    """Create owed and given debts on the API test wallet, one of them overdue"""
+    from decimal import Decimal
+    from app.db.models.debt import Debt
+
+    debts = db.scalars(
+        insert(Debt).returning(Debt),
+        [
+            {
+                "amount": Decimal("500.00"),
+                "borrower": "Charlie",
+                "type": "owed",
+                "description": "Money owed by Charlie",
+                "due_date": now - timedelta(days=5),
+                "wallet_id": test_wallet_api["id"],
+            },
+            {
+                "amount": Decimal("300.00"),
+                "borrower": "Diana",
+                "type": "given",
+                "description": "Money owed to Diana",
+                "wallet_id": test_wallet_api["id"],
+            },
+            {
+                "amount": Decimal("150.00"),
+                "borrower": "Eve",
+                "type": "owed",
+                "description": "Small loan to Eve",
+                "due_date": now + timedelta(days=10),
+                "wallet_id": test_wallet_api["id"],
+            },
+        ],
+    ).all()
+    stage_rows(db)
+
+    return debts
@@ -1,12 +1,14 @@
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 from sqlalchemy.orm import Session
+from app.schemas.user_dto import UserExportData
+from tests.utils import assert_json_contains
 
 
 class TestAuth:
     """Test authentication endpoints"""
 
-    def test_register_user_success(self, client: TestClient):
+    async def test_register_user_success(self, async_client: AsyncClient):
         """Test successful user registration"""
         user_data = {
             "name": "New User",
@@ -14,7 +16,7 @@ class TestAuth:
             "password": "password123",
         }
 
-        response = client.post("/auth/register", json=user_data)
+        response = await async_client.post("/auth/register", json=user_data)
 
         assert response.status_code == 201
         data = response.json()
@@ -24,7 +26,9 @@ class TestAuth:
         assert "id" in data
         assert "hashed_password" not in data
 
-    def test_register_user_duplicate_email(self, client: TestClient, test_user):
+    async def test_register_user_duplicate_email(
+        self, async_client: AsyncClient, test_user
+    ):
         """Test registration with existing email"""
         user_data = {
             "name": "Duplicate User",
@@ -32,31 +36,18 @@ class TestAuth:
             "password": "password123",
         }
 
-        response = client.post("/auth/register", json=user_data)
+        response = await async_client.post("/auth/register", json=user_data)
 
         assert response.status_code == 400
-        assert (
-            "a user with this email already exists."
-            in response.json()["detail"].lower()
+        assert_json_contains(
+            response, "detail", "A user with this email already exists."
         )
 
-    def test_register_user_invalid_data(self, client: TestClient):
-        """Test registration with invalid data"""
-        user_data = {
-            "name": "",
-            "email": "invalid-email",
-            "password": "123",  # Too short
-        }
-
-        response = client.post("/auth/register", json=user_data)
-
-        assert response.status_code == 422
-
-    def test_login_success(self, client: TestClient, test_user):
+    async def test_login_success(self, async_client: AsyncClient, test_user):
         """Test successful login"""
         form_data = {"username": test_user.email, "password": "testpassword123"}
 
-        response = client.post("/auth/token", data=form_data)
+        response = await async_client.post("/auth/token", data=form_data)
 
         assert response.status_code == 200
         data = response.json()
@@ -64,26 +55,20 @@ class TestAuth:
         assert "refresh_token" in data
         assert data["token_type"] == "bearer"
 
-    def test_login_invalid_credentials(self, client: TestClient, test_user):
+    async def test_login_invalid_credentials(
+        self, async_client: AsyncClient, test_user
+    ):
         """Test login with invalid credentials"""
         form_data = {"username": test_user.email, "password": "wrongpassword"}
 
-        response = client.post("/auth/token", data=form_data)
-
-        assert response.status_code == 401
-        assert "incorrect email or password" in response.json()["detail"].lower()
-
-    def test_login_nonexistent_user(self, client: TestClient):
-        """Test login with non-existent user"""
-        form_data = {"username": "nonexistent@example.com", "password": "password123"}
-
-        response = client.post("/auth/token", data=form_data)
+        response = await async_client.post("/auth/token", data=form_data)
 
         assert response.status_code == 401
+        assert_json_contains(response, "detail", "Incorrect email or password")
 
-    def test_refresh_token_success(self, client: TestClient, user_auth):
+    async def test_refresh_token_success(self, async_client: AsyncClient, user_auth):
         """Test successful token refresh"""
-        response = client.post(
+        response = await async_client.post(
             "/auth/token/refresh", json={"refresh_token": user_auth["refresh_token"]}
         )
 
@@ -96,18 +81,9 @@ class TestAuth:
         assert data["access_token"] != user_auth["access_token"]
         assert data["refresh_token"] != user_auth["refresh_token"]
 
-    def test_refresh_token_invalid(self, client: TestClient):
-        """Test refresh with invalid token"""
-        response = client.post(
-            "/auth/token/refresh", json={"refresh_token": "invalid_refresh_token"}
-        )
-
-        assert response.status_code == 401
-        assert "invalid refresh token" in response.json()["detail"].lower()
-
-    def test_logout_success(self, client: TestClient, user_auth):
+    async def test_logout_success(self, async_client: AsyncClient, user_auth):
         """Test successful logout"""
-        response = client.post(
+        response = await async_client.post(
             "/auth/logout",
             json={"refresh_token": user_auth["refresh_token"]},
             headers=user_auth["headers"],
@@ -116,20 +92,11 @@ class TestAuth:
         assert response.status_code == 200
         assert response.json()["message"] == "Successfully logged out"
 
-    def test_logout_invalid_token(self, client: TestClient, auth_headers):
-        """Test logout with invalid refresh token"""
-        response = client.post(
-            "/auth/logout",
-            json={"refresh_token": "invalid_token"},
-            headers=auth_headers,
-        )
-
-        assert response.status_code == 401
-        assert "invalid refresh token" in response.json()["detail"].lower()
-
-    def test_get_profile(self, client: TestClient, test_user, auth_headers):
+    async def test_get_profile(
+        self, async_client: AsyncClient, test_user, auth_headers
+    ):
         """Test getting user profile"""
-        response = client.get("/auth/profile", headers=auth_headers)
+        response = await async_client.get("/auth/profile", headers=auth_headers)
 
         assert response.status_code == 200
         data = response.json()
@@ -138,93 +105,164 @@ class TestAuth:
         assert data["id"] == test_user.id
         assert "hashed_password" not in data
 
-    def test_get_profile_unauthorized(self, client: TestClient):
-        """Test getting profile without authentication"""
-        response = client.get("/auth/profile")
-
-        assert response.status_code == 401
-
-    def test_update_profile(self, client: TestClient, auth_headers):
+    async def test_update_profile(self, async_client: AsyncClient, auth_headers):
         """Test updating user profile"""
         update_data = {"name": "Updated Name", "email": "updated@example.com"}
 
-        response = client.put("/auth/profile", json=update_data, headers=auth_headers)
+        response = await async_client.put(
+            "/auth/profile", json=update_data, headers=auth_headers
+        )
 
         assert response.status_code == 200
         data = response.json()
         assert data["name"] == update_data["name"]
         assert data["email"] == update_data["email"]
 
-    def test_change_password(self, client: TestClient, auth_headers):
+    async def test_change_password(self, async_client: AsyncClient, auth_headers):
         """Test changing password"""
         password_data = {
             "current_password": "testpassword123",
             "new_password": "newpassword123",
         }
 
-        response = client.put(
+        response = await async_client.put(
             "/auth/password", json=password_data, headers=auth_headers
         )
 
         assert response.status_code == 200
         assert response.json()["message"] == "Password updated successfully"
 
-    def test_change_password_wrong_current(self, client: TestClient, auth_headers):
+    async def test_change_password_wrong_current(
+        self, async_client: AsyncClient, auth_headers
+    ):
         """Test changing password with wrong current password"""
         password_data = {
             "current_password": "wrongpassword",
             "new_password": "newpassword123",
         }
 
-        response = client.put(
+        response = await async_client.put(
             "/auth/password", json=password_data, headers=auth_headers
         )
 
         assert response.status_code == 400
-        assert "current password is incorrect" in response.json()["detail"].lower()
+        assert_json_contains(response, "detail", "Current password is incorrect")
 
-    def test_delete_account_success(self, client: TestClient, user_auth):
+    async def test_delete_account_success(
+        self, async_client: AsyncClient, auth_headers
+    ):
         """Test successful account deletion"""
-        response = client.delete("/auth/account", headers=user_auth["headers"])
+        # Delete a per-test user rather than the shared session user
+        response = await async_client.delete("/auth/account", headers=auth_headers)
 
         assert response.status_code == 200
         assert response.json()["message"] == "Account deleted successfully"
 
-    def test_delete_account_unauthorized(self, client: TestClient):
-        """Test account deletion without authentication"""
-        response = client.delete("/auth/account")
-
-        assert response.status_code == 401
-
-    def test_get_gdpr_data(self, client: TestClient, test_user, auth_headers):
+    async def test_get_gdpr_data(
+        self, async_client: AsyncClient, test_user, auth_headers
+    ):
         """Test getting GDPR data export"""
-        response = client.get("/auth/gdpr/data", headers=auth_headers)
+        response = await async_client.get("/auth/gdpr/data", headers=auth_headers)
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["user_info"]["email"] == test_user.email
-        assert data["user_info"]["name"] == test_user.name
-        assert "wallets" in data
-        assert "transactions" in data
-        assert "debts" in data
-        assert "transfers" in data
-        assert "export_timestamp" in data
-
-    def test_protected_route_with_valid_token(self, client: TestClient, auth_headers):
-        """Test accessing protected route with valid token"""
-        response = client.get("/auth/profile", headers=auth_headers)
+        export = UserExportData.model_validate(response.json())
+        assert export.user_info.email == test_user.email
+        assert export.user_info.name == test_user.name
+
+    async def test_gdpr_no_n_plus_one(
+        self,
+        async_client: AsyncClient,
+        auth_headers,
+        wallets_with_transactions,
+        query_counter,
+    ):
+        """Test GDPR export runs a fixed number of queries regardless of data size"""
+        with query_counter() as statements:
+            response = await async_client.get("/auth/gdpr/data", headers=auth_headers)
 
         assert response.status_code == 200
+        data = response.json()
+        assert len(data["wallets"]) == 10
+        assert len(data["transactions"]) == 50
 
-    def test_protected_route_with_invalid_token(self, client: TestClient):
-        """Test accessing protected route with invalid token"""
-        headers = {"Authorization": "Bearer invalid_token"}
-        response = client.get("/auth/profile", headers=headers)
+        # One query per entity type, never one per wallet or transaction
+        selects = [s for s in statements if s.lstrip().startswith("SELECT")]
+        assert len(selects) <= 7
 
-        assert response.status_code == 401
+    async def test_protected_route_with_valid_token(
+        self, async_client: AsyncClient, auth_headers
+    ):
+        """Test accessing protected route with valid token"""
+        response = await async_client.get("/auth/profile", headers=auth_headers)
 
-    def test_protected_route_without_token(self, client: TestClient):
-        """Test accessing protected route without token"""
-        response = client.get("/auth/profile")
+        assert response.status_code == 200
 
-        assert response.status_code == 401
+    @pytest.mark.parametrize(
+        "method,url,request_kwargs,expected_status,expected_detail",
+        [
+            pytest.param(
+                "POST",
+                "/auth/register",
+                {"json": {"name": "", "email": "invalid-email", "password": "123"}},
+                422,
+                None,
+                id="register-invalid-data",
+            ),
+            pytest.param(
+                "POST",
+                "/auth/token",
+                {
+                    "data": {
+                        "username": "nonexistent@example.com",
+                        "password": "password123",
+                    }
+                },
+                401,
+                "Incorrect email or password",
+                id="login-nonexistent-user",
+            ),
+            pytest.param(
+                "POST",
+                "/auth/token/refresh",
+                {"json": {"refresh_token": "invalid_refresh_token"}},
+                401,
+                "Invalid refresh token",
+                id="refresh-invalid-token",
+            ),
+            pytest.param(
+                "POST",
+                "/auth/logout",
+                {"json": {"refresh_token": "invalid_token"}},
+                401,
+                "Invalid refresh token",
+                id="logout-invalid-token",
+            ),
+            pytest.param(
+                "GET",
+                "/auth/profile",
+                {"headers": {"Authorization": "Bearer invalid_token"}},
+                401,
+                None,
+                id="profile-invalid-token",
+            ),
+            pytest.param("GET", "/auth/profile", {}, 401, None, id="profile-no-token"),
+            pytest.param(
+                "DELETE", "/auth/account", {}, 401, None, id="delete-account-no-token"
+            ),
+        ],
+    )
+    async def test_rejected_requests(
+        self,
+        async_client: AsyncClient,
+        method,
+        url,
+        request_kwargs,
+        expected_status,
+        expected_detail,
+    ):
+        """Test invalid or unauthenticated requests are rejected"""
+        response = await async_client.request(method, url, **request_kwargs)
+
+        assert response.status_code == expected_status
+        if expected_detail:
+            assert_json_contains(response, "detail", expected_detail)
@@ -12,7 +12,7 @@ from app.db.models.user import User
 from app.db.models.category import Category
 
 
-def test_category_seeder_for_user(db: Session, test_user: User):
+def test_category_seeder_for_user(db: Session, test_user: User, query_counter):
     """Test the category seeder with a test user"""
 
     # Initialize seeder
@@ -22,8 +22,10 @@ def test_category_seeder_for_user(db: Session, test_user: User):
     initial_count = seeder.get_user_category_count(test_user.id)
     assert initial_count == 0  # Should start with no categories
 
-    # Seed categories for the test user
-    created_count = seeder.seed_for_user(test_user.id)
+    # Seed categories for the test user: one SELECT + one batched INSERT
+    with query_counter() as statements:
+        created_count = seeder.seed_for_user(test_user.id)
+    assert len(statements) <= 2
 
     # Commit the transaction to persist changes
     seeder.commit()
@@ -112,23 +114,15 @@ def test_category_seeder_default_categories():
     assert len(default_categories) > 30
 
     # Should have income and expense categories (based on names)
-    income_names = ["Salary", "Freelance", "Investment Returns", "Bonus"]
-    expense_names = ["Groceries", "Rent/Mortgage", "Entertainment", "Shopping"]
-
-    category_names = [cat["name"] for cat in default_categories]
-
-    # Check that we have income categories
-    for income_name in income_names:
-        assert income_name in category_names
-
-    # Check that we have expense categories
-    for expense_name in expense_names:
-        assert expense_name in category_names
+    income_names = {"Salary", "Freelance", "Investment Returns", "Bonus"}
+    expense_names = {"Groceries", "Rent/Mortgage", "Entertainment", "Shopping"}
 
     # Each category should have required fields
+    category_names = set()
     for category in default_categories:
-        assert "name" in category
-        assert "color" in category
-        assert "icon" in category
+        assert category.keys() >= {"name", "color", "icon"}
         assert category["color"].startswith("#")
         assert len(category["color"]) == 7  # Should be hex color
+        category_names.add(category["name"])
+
+    assert income_names | expense_names <= category_names
@@ -1,53 +1,47 @@
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
+from app.schemas.user_dto import UserDataSummary
 
 
 class TestDataSummary:
     """Test data summary endpoint"""
 
-    def test_get_data_summary_success(self, client: TestClient, user_auth):
+    async def test_get_data_summary_success(self, async_client: AsyncClient, user_auth):
         """Test successful data summary retrieval"""
-        response = client.get("/auth/data-summary", headers=user_auth["headers"])
+        response = await async_client.get(
+            "/auth/data-summary", headers=user_auth["headers"]
+        )
 
         assert response.status_code == 200
+
+        # Validate every field and its type in a single pass
         data = response.json()
+        summary = UserDataSummary.model_validate(data)
 
-        # Verify all expected fields are present
-        assert "user_id" in data
-        assert "email" in data
-        assert "account_created" in data
-        assert "wallets_count" in data
-        assert "transactions_count" in data
-        assert "debts_count" in data
-        assert "transfers_count" in data
-        assert "total_balance" in data
-        assert "data_summary_generated_at" in data
-
-        # Verify data types
-        assert isinstance(data["user_id"], int)
-        assert isinstance(data["email"], str)
-        assert isinstance(data["wallets_count"], int)
-        assert isinstance(data["transactions_count"], int)
-        assert isinstance(data["debts_count"], int)
-        assert isinstance(data["transfers_count"], int)
+        # The balance is sent as a JSON number, not a Decimal string
+        assert isinstance(data["total_balance"], (int, float))
 
         # Verify counts are non-negative
-        assert data["wallets_count"] >= 0
-        assert data["transactions_count"] >= 0
-        assert data["debts_count"] >= 0
-        assert data["transfers_count"] >= 0
+        assert summary.wallets_count >= 0
+        assert summary.transactions_count >= 0
+        assert summary.debts_count >= 0
+        assert summary.transfers_count >= 0
 
-    def test_get_data_summary_with_data(self, client: TestClient, user_auth):
+    async def test_get_data_summary_with_data(
+        self, async_client: AsyncClient, user_auth
+    ):
         """Test data summary with actual data"""
         # Create a wallet first
         wallet_data = {"name": "Test Wallet", "type": "checking", "balance": 1000.00}
-        wallet_response = client.post(
+        wallet_response = await async_client.post(
             "/wallets/", json=wallet_data, headers=user_auth["headers"]
         )
         assert wallet_response.status_code == 201
 
         # Get data summary (should show at least 1 wallet)
-        response = client.get("/auth/data-summary", headers=user_auth["headers"])
+        response = await async_client.get(
+            "/auth/data-summary", headers=user_auth["headers"]
+        )
 
         assert response.status_code == 200
         data = response.json()
@@ -55,8 +49,30 @@ class TestDataSummary:
         # Verify counts reflect the created data
         assert data["wallets_count"] >= 1
 
-    def test_get_data_summary_unauthorized(self, client: TestClient):
+    async def test_get_data_summary_unauthorized(self, async_client: AsyncClient):
         """Test data summary without authentication"""
-        response = client.get("/auth/data-summary")
+        response = await async_client.get("/auth/data-summary")
 
         assert response.status_code == 401
+
+    async def test_data_summary_no_n_plus_one(
+        self,
+        async_client: AsyncClient,
+        auth_headers,
+        wallets_with_transactions,
+        query_counter,
+    ):
+        """Test data summary runs a fixed number of queries regardless of data size"""
+        with query_counter() as statements:
+            response = await async_client.get(
+                "/auth/data-summary", headers=auth_headers
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["wallets_count"] == 10
+        assert data["transactions_count"] == 50
+
+        # Counts are aggregated in SQL rather than by loading rows
+        selects = [s for s in statements if s.lstrip().startswith("SELECT")]
+        assert len(selects) <= 5
@@ -1,116 +1,147 @@
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
+from collections import defaultdict
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from decimal import Decimal
 from datetime import datetime
-from app.db.models.transaction import TransactionType, TransactionCategory
-import math
+from types import MappingProxyType
+from typing import Iterator
+from app.db.models.category import Category
+from app.db.models.transaction import (
+    Transaction,
+    TransactionType,
+    TransactionCategory,
+)
+from app.core.security import get_current_user
+from app.db.models.wallet import Wallet
+from app.main import app
+from app.schemas.transaction_dto import TransactionCreateDTO
+from app.schemas.user_dto import UserResponse
+from app.services.transaction_service import TransactionService
+from tests.utils import apply_balance_deltas
+
+# Minimal transaction payload shared by the validation and auth tests
+_BASE_TRANSACTION = MappingProxyType(
+    {"type": "income", "amount": 100.00, "category": "salary"}
+)
 
 
 # Top-level fixture for user-defined category
-@pytest.fixture(scope="function")
-def user_category(client, user_auth):
-    """Create a user-defined category and return its id."""
-    payload = {"name": "Test UserCat", "color": "#123456", "icon": "test-icon"}
-    response = client.post("/categories/", json=payload, headers=user_auth["headers"])
-    assert response.status_code == 201
-    return response.json()["id"]
+@pytest.fixture
+def user_category(db: Session, user_auth) -> int:
+    """Create a user-defined category through the ORM and return its id."""
+    return db.scalars(
+        insert(Category).returning(Category.id),
+        [
+            {
+                "name": "Test UserCat",
+                "color": "#123456",
+                "icon": "test-icon",
+                "user_id": user_auth["user"]["id"],
+            }
+        ],
+    ).one()
+
+
+@pytest.fixture
+def current_user(user_auth) -> Iterator[UserResponse]:
+    """
+    Authenticate every request as the session user without a token.
+    Skips the per-request JWT decode and user lookup of get_current_user.
+    """
+    user = UserResponse.model_validate(user_auth["user"])
+    app.dependency_overrides[get_current_user] = lambda: user
+    yield user
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+def _seed_transactions(db: Session, rows: list[dict]) -> list[int]:
+    """
+    Insert transactions in one executemany round trip, bypassing the API.
+    Wallet balances are moved by the net amount per wallet, as the create
+    endpoint would, with one executemany UPDATE.
+    """
+    ids = db.scalars(insert(Transaction).returning(Transaction.id), rows).all()
+
+    deltas = defaultdict(Decimal)
+    for row in rows:
+        sign = 1 if row["type"] == TransactionType.INCOME else -1
+        deltas[row["wallet_id"]] += sign * Decimal(row["amount"])
+
+    apply_balance_deltas(db, deltas)
+    return ids
 
 
 class TestTransactions:
     """Test transaction management endpoints"""
 
-    def test_create_transaction_income_success(
-        self, client: TestClient, user_auth, test_wallet_api
+    @pytest.mark.parametrize(
+        "ttype,amount,category,note",
+        [
+            ("income", 1500.00, "salary", "Monthly salary"),
+            ("expense", 150.00, "food", "Grocery shopping"),
+        ],
+        ids=["income", "expense"],
+    )
+    async def test_create_transaction_success(
+        self,
+        async_client: AsyncClient,
+        current_user,
+        test_wallet_api,
+        ttype,
+        amount,
+        category,
+        note,
     ):
-        """Test successful income transaction creation"""
+        """Test successful income and expense transaction creation"""
         transaction_data = {
-            "type": "income",
-            "amount": 1500.00,
-            "category": "salary",
-            "note": "Monthly salary",
+            "type": ttype,
+            "amount": amount,
+            "category": category,
+            "note": note,
             "wallet_id": test_wallet_api["id"],
         }
 
-        response = client.post(
-            "/transactions/", json=transaction_data, headers=user_auth["headers"]
-        )
+        response = await async_client.post("/transactions/", json=transaction_data)
 
         assert response.status_code == 201
         data = response.json()
-        assert data["type"] == "income"
-        assert math.isclose(float(data["amount"]), 1500.00, rel_tol=1e-9)
-        assert data["category"] == "salary"
-        assert data["note"] == "Monthly salary"
+        assert data["type"] == ttype
+        assert Decimal(str(data["amount"])) == Decimal(str(amount))
+        assert data["category"] == category
+        assert data["note"] == note
         assert data["wallet_id"] == test_wallet_api["id"]
         assert "id" in data
         assert "created_at" in data
 
-    def test_create_transaction_expense_success(
-        self, client: TestClient, user_auth, test_wallet_api
+    async def test_create_transaction_unauthorized(
+        self, async_client: AsyncClient, test_wallet_api
     ):
-        """Test successful expense transaction creation"""
-        transaction_data = {
-            "type": "expense",
-            "amount": 150.00,
-            "category": "food",
-            "note": "Grocery shopping",
-            "wallet_id": test_wallet_api["id"],
-        }
-
-        response = client.post(
-            "/transactions/", json=transaction_data, headers=user_auth["headers"]
-        )
-
-        assert response.status_code == 201
-        data = response.json()
-        assert data["type"] == "expense"
-        assert math.isclose(float(data["amount"]), 150.00, rel_tol=1e-9)
-        assert data["category"] == "food"
-        assert data["note"] == "Grocery shopping"
-
-    def test_create_transaction_unauthorized(self, client: TestClient, test_wallet_api):
         """Test transaction creation without authentication"""
-        transaction_data = {
-            "type": "income",
-            "amount": 100.00,
-            "category": "salary",
-            "wallet_id": test_wallet_api["id"],
-        }
+        transaction_data = {**_BASE_TRANSACTION, "wallet_id": test_wallet_api["id"]}
 
-        response = client.post("/transactions/", json=transaction_data)
+        response = await async_client.post("/transactions/", json=transaction_data)
 
         assert response.status_code == 401
 
-    def test_create_transaction_invalid_wallet(self, client: TestClient, user_auth):
+    async def test_create_transaction_invalid_wallet(
+        self, async_client: AsyncClient, current_user
+    ):
         """Test transaction creation with non-existent wallet"""
-        transaction_data = {
-            "type": "income",
-            "amount": 100.00,
-            "category": "salary",
-            "wallet_id": 99999,
-        }
+        transaction_data = {**_BASE_TRANSACTION, "wallet_id": 99999}
 
-        response = client.post(
-            "/transactions/", json=transaction_data, headers=user_auth["headers"]
-        )
+        response = await async_client.post("/transactions/", json=transaction_data)
 
         assert response.status_code == 400
         assert "not found" in response.json()["detail"].lower()
 
-    def test_create_transaction_insufficient_funds(self, client: TestClient, user_auth):
+    async def test_create_transaction_insufficient_funds(
+        self, async_client: AsyncClient, current_user, wallet_factory
+    ):
         """Test expense transaction with insufficient funds"""
         # First create a wallet with low balance
-        wallet_data = {
-            "name": "Low Balance Wallet",
-            "type": "checking",
-            "balance": 50.00,
-        }
-
-        wallet_response = client.post(
-            "/wallets/", json=wallet_data, headers=user_auth["headers"]
-        )
-        wallet_id = wallet_response.json()["id"]
+        wallet_id = wallet_factory(name="Low Balance Wallet", balance=Decimal("50.00"))
 
         # Try to create expense transaction larger than balance
         transaction_data = {
@@ -120,24 +151,17 @@ class TestTransactions:
             "wallet_id": wallet_id,
         }
 
-        response = client.post(
-            "/transactions/", json=transaction_data, headers=user_auth["headers"]
-        )
+        response = await async_client.post("/transactions/", json=transaction_data)
 
         assert response.status_code == 400
         assert "insufficient funds" in response.json()["detail"].lower()
 
-    def test_create_transaction_credit_wallet_overdraft(
-        self, client: TestClient, user_auth
+    async def test_create_transaction_credit_wallet_overdraft(
+        self, async_client: AsyncClient, current_user, wallet_factory
     ):
         """Test expense transaction on credit wallet (should allow overdraft)"""
         # Create credit wallet
-        wallet_data = {"name": "Credit Card", "type": "credit", "balance": 0.00}
-
-        wallet_response = client.post(
-            "/wallets/", json=wallet_data, headers=user_auth["headers"]
-        )
-        wallet_id = wallet_response.json()["id"]
+        wallet_id = wallet_factory(name="Credit Card", type="credit")
 
         # Create expense transaction (should work for credit wallet)
         transaction_data = {
@@ -147,86 +171,84 @@ class TestTransactions:
             "wallet_id": wallet_id,
         }
 
-        response = client.post(
-            "/transactions/", json=transaction_data, headers=user_auth["headers"]
-        )
+        response = await async_client.post("/transactions/", json=transaction_data)
 
         assert response.status_code == 201
 
-    def test_get_user_transactions(
-        self, client: TestClient, user_auth, test_wallet_api, user_category
+    async def test_get_user_transactions(
+        self,
+        async_client: AsyncClient,
+        db: Session,
+        current_user,
+        test_wallet_api,
+        user_category,
     ):
         """Test getting user's transactions"""
         # Create a couple of transactions first
-
-        transactions = [
-            {
-                "type": "income",
-                "amount": 1000.00,
-                "category": "salary",
-                "note": "Salary deposit",
-                "wallet_id": test_wallet_api["id"],
-            },
-            {
-                "type": "expense",
-                "amount": 200.00,
-                "category_id": user_category,
-                "note": "Groceries",
-                "wallet_id": test_wallet_api["id"],
-            },
-        ]
-        for transaction_data in transactions:
-            client.post(
-                "/transactions/", json=transaction_data, headers=user_auth["headers"]
-            )
+        _seed_transactions(
+            db,
+            [
+                {
+                    "type": TransactionType.INCOME,
+                    "amount": Decimal("1000.00"),
+                    "category": TransactionCategory.SALARY,
+                    "note": "Salary deposit",
+                    "wallet_id": test_wallet_api["id"],
+                },
+                {
+                    "type": TransactionType.EXPENSE,
+                    "amount": Decimal("200.00"),
+                    "category_id": user_category,
+                    "note": "Groceries",
+                    "wallet_id": test_wallet_api["id"],
+                },
+            ],
+        )
 
         # Get transactions
-        response = client.get("/transactions/", headers=user_auth["headers"])
+        response = await async_client.get("/transactions/")
 
         assert response.status_code == 200
         data = response.json()
 
     # (Removed misplaced assertions from class level. All logic is now inside test methods.)
 
-    def test_get_transactions_with_filters(
-        self, client: TestClient, user_auth, test_wallet_api
+    async def test_get_transactions_with_filters(
+        self, async_client: AsyncClient, db: Session, current_user, test_wallet_api
     ):
         """Test getting transactions with filters"""
         # Create transactions with different types and categories
-        transactions = [
-            {
-                "type": "income",
-                "amount": 1500.00,
-                "category": "salary",
-                "note": "Monthly salary",
-                "wallet_id": test_wallet_api["id"],
-            },
-            {
-                "type": "expense",
-                "amount": 300.00,
-                "category": "food",
-                "note": "Restaurant",
-                "wallet_id": test_wallet_api["id"],
-            },
-            {
-                "type": "expense",
-                "amount": 100.00,
-                "category": "transport",
-                "note": "Gas",
-                "wallet_id": test_wallet_api["id"],
-            },
-        ]
-
-        for transaction_data in transactions:
-            client.post(
-                "/transactions/", json=transaction_data, headers=user_auth["headers"]
-            )
+        _seed_transactions(
+            db,
+            [
+                {
+                    "type": TransactionType.INCOME,
+                    "amount": Decimal("1500.00"),
+                    "category": TransactionCategory.SALARY,
+                    "note": "Monthly salary",
+                    "wallet_id": test_wallet_api["id"],
+                },
+                {
+                    "type": TransactionType.EXPENSE,
+                    "amount": Decimal("300.00"),
+                    "category": TransactionCategory.FOOD,
+                    "note": "Restaurant",
+                    "wallet_id": test_wallet_api["id"],
+                },
+                {
+                    "type": TransactionType.EXPENSE,
+                    "amount": Decimal("100.00"),
+                    "category": TransactionCategory.TRANSPORT,
+                    "note": "Gas",
+                    "wallet_id": test_wallet_api["id"],
+                },
+            ],
+        )
 
         # Filter by type (income)
-        response = client.get(
+        response = await async_client.get(
             "/transactions/",
             params={"transaction_type": "income"},
-            headers=user_auth["headers"],
         )
 
         assert response.status_code == 200
@@ -235,68 +257,53 @@ class TestTransactions:
         assert len(income_transactions) >= 1
 
         # Filter by category (food)
-        response = client.get(
-            "/transactions/", params={"category": "food"}, headers=user_auth["headers"]
-        )
+        response = await async_client.get("/transactions/", params={"category": "food"})
 
         assert response.status_code == 200
         data = response.json()
         food_transactions = [t for t in data["transactions"] if t["category"] == "food"]
         assert len(food_transactions) >= 1
 
-    def test_get_transaction_by_id(
-        self, client: TestClient, user_auth, test_wallet_api
+    async def test_get_transaction_by_id(
+        self, async_client: AsyncClient, current_user, transaction_factory
     ):
         """Test getting specific transaction by ID"""
         # Create a transaction
-        transaction_data = {
-            "type": "income",
-            "amount": 800.00,
-            "category": "freelance",
-            "note": "Web development project",
-            "wallet_id": test_wallet_api["id"],
-        }
-
-        create_response = client.post(
-            "/transactions/", json=transaction_data, headers=user_auth["headers"]
+        transaction_id = transaction_factory(
+            type="income",
+            amount=Decimal("800.00"),
+            category="freelance",
+            note="Web development project",
         )
-        transaction_id = create_response.json()["id"]
 
         # Get the transaction
-        response = client.get(
-            f"/transactions/{transaction_id}", headers=user_auth["headers"]
-        )
+        response = await async_client.get(f"/transactions/{transaction_id}")
 
         assert response.status_code == 200
         data = response.json()
         assert data["id"] == transaction_id
-        assert math.isclose(float(data["amount"]), 800.00, rel_tol=1e-9)
+        assert Decimal(str(data["amount"])) == Decimal("800.00")
         assert data["category"] == "freelance"
 
-    def test_get_transaction_not_found(self, client: TestClient, user_auth):
-        """Test getting non-existent transaction"""
-        response = client.get("/transactions/99999", headers=user_auth["headers"])
+    @pytest.mark.parametrize(
+        "method,data",
+        [("GET", None), ("PUT", {"amount": 100.00}), ("DELETE", None)],
+    )
+    async def test_transaction_not_found(
+        self, async_client: AsyncClient, current_user, method, data
+    ):
+        """Test getting, updating and deleting a non-existent transaction"""
+        response = await async_client.request(method, "/transactions/99999", json=data)
 
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    def test_update_transaction_success(
-        self, client: TestClient, user_auth, test_wallet_api
+    async def test_update_transaction_success(
+        self, async_client: AsyncClient, current_user, transaction_factory
     ):
         """Test successful transaction update"""
         # Create transaction
-        transaction_data = {
-            "type": "expense",
-            "amount": 100.00,
-            "category": "food",
-            "note": "Original note",
-            "wallet_id": test_wallet_api["id"],
-        }
-
-        create_response = client.post(
-            "/transactions/", json=transaction_data, headers=user_auth["headers"]
-        )
-        transaction_id = create_response.json()["id"]
+        transaction_id = transaction_factory(note="Original note")
 
         # Update transaction
         update_data = {
@@ -305,98 +312,70 @@ class TestTransactions:
             "category": "entertainment",
         }
 
-        response = client.put(
+        response = await async_client.put(
             f"/transactions/{transaction_id}",
             json=update_data,
-            headers=user_auth["headers"],
         )
 
         assert response.status_code == 200
         data = response.json()
-        assert math.isclose(float(data["amount"]), 150.00, rel_tol=1e-9)
+        assert Decimal(str(data["amount"])) == Decimal("150.00")
         assert data["note"] == "Updated note"
         assert data["category"] == "entertainment"
 
-    def test_update_transaction_not_found(self, client: TestClient, user_auth):
-        """Test updating non-existent transaction"""
-        update_data = {"amount": 100.00}
-
-        response = client.put(
-            "/transactions/99999", json=update_data, headers=user_auth["headers"]
-        )
-
-        assert response.status_code == 404
-
-    def test_delete_transaction_success(
-        self, client: TestClient, user_auth, test_wallet_api
+    async def test_delete_transaction_success(
+        self, async_client: AsyncClient, current_user, transaction_factory
     ):
         """Test successful transaction deletion"""
         # Create transaction
-        transaction_data = {
-            "type": "expense",
-            "amount": 50.00,
-            "category": "transport",
-            "wallet_id": test_wallet_api["id"],
-        }
-
-        create_response = client.post(
-            "/transactions/", json=transaction_data, headers=user_auth["headers"]
+        transaction_id = transaction_factory(
+            amount=Decimal("50.00"), category="transport"
         )
-        transaction_id = create_response.json()["id"]
 
         # Delete transaction
-        response = client.delete(
-            f"/transactions/{transaction_id}", headers=user_auth["headers"]
-        )
+        response = await async_client.delete(f"/transactions/{transaction_id}")
 
         assert response.status_code == 200
         assert "deleted successfully" in response.json()["message"].lower()
 
-    def test_delete_transaction_not_found(self, client: TestClient, user_auth):
-        """Test deleting non-existent transaction"""
-        response = client.delete("/transactions/99999", headers=user_auth["headers"])
-
-        assert response.status_code == 404
-
-    def test_get_transaction_summary(
-        self, client: TestClient, user_auth, test_wallet_api
+    async def test_get_transaction_summary(
+        self, async_client: AsyncClient, db: Session, current_user, test_wallet_api
     ):
         """Test getting transaction summary"""
         # Create various transactions
-        transactions = [
-            {
-                "type": "income",
-                "amount": 2000.00,
-                "category": "salary",
-                "wallet_id": test_wallet_api["id"],
-            },
-            {
-                "type": "income",
-                "amount": 500.00,
-                "category": "freelance",
-                "wallet_id": test_wallet_api["id"],
-            },
-            {
-                "type": "expense",
-                "amount": 300.00,
-                "category": "food",
-                "wallet_id": test_wallet_api["id"],
-            },
-            {
-                "type": "expense",
-                "amount": 200.00,
-                "category": "transport",
-                "wallet_id": test_wallet_api["id"],
-            },
-        ]
-
-        for transaction_data in transactions:
-            client.post(
-                "/transactions/", json=transaction_data, headers=user_auth["headers"]
-            )
+        wallet_id = test_wallet_api["id"]
+        _seed_transactions(
+            db,
+            [
+                {
+                    "type": TransactionType.INCOME,
+                    "amount": Decimal("2000.00"),
+                    "category": TransactionCategory.SALARY,
+                    "wallet_id": wallet_id,
+                },
+                {
+                    "type": TransactionType.INCOME,
+                    "amount": Decimal("500.00"),
+                    "category": TransactionCategory.FREELANCE,
+                    "wallet_id": wallet_id,
+                },
+                {
+                    "type": TransactionType.EXPENSE,
+                    "amount": Decimal("300.00"),
+                    "category": TransactionCategory.FOOD,
+                    "wallet_id": wallet_id,
+                },
+                {
+                    "type": TransactionType.EXPENSE,
+                    "amount": Decimal("200.00"),
+                    "category": TransactionCategory.TRANSPORT,
+                    "wallet_id": wallet_id,
+                },
+            ],
+        )
 
         # Get summary
-        response = client.get("/transactions/summary", headers=user_auth["headers"])
+        response = await async_client.get("/transactions/summary")
 
         assert response.status_code == 200
         data = response.json()
@@ -407,49 +386,41 @@ class TestTransactions:
         assert "transactions_by_type" in data
 
         # Verify calculations
-        assert float(data["total_income"]) >= 2500.00  # 2000 + 500
-        assert float(data["total_expenses"]) >= 500.00  # 300 + 200
-        assert float(data["net_amount"]) >= 2000.00  # 2500 - 500
+        assert Decimal(str(data["total_income"])) == Decimal("2500.00")  # 2000 + 500
+        assert Decimal(str(data["total_expenses"])) == Decimal("500.00")  # 300 + 200
+        assert Decimal(str(data["net_amount"])) == Decimal("2000.00")  # 2500 - 500
 
-    def test_get_wallet_transactions(self, client: TestClient, user_auth):
+    async def test_get_wallet_transactions(
+        self, async_client: AsyncClient, db: Session, current_user, wallet_factory
+    ):
         """Test getting transactions for a specific wallet"""
         # Create two wallets
-        wallet1_data = {"name": "Wallet 1", "type": "checking", "balance": 1000.00}
-
-        wallet2_data = {"name": "Wallet 2", "type": "savings", "balance": 2000.00}
-
-        wallet1_response = client.post(
-            "/wallets/", json=wallet1_data, headers=user_auth["headers"]
+        wallet1_id = wallet_factory(name="Wallet 1", balance=Decimal("1000.00"))
+        wallet2_id = wallet_factory(
+            name="Wallet 2", type="savings", balance=Decimal("2000.00")
         )
-        wallet2_response = client.post(
-            "/wallets/", json=wallet2_data, headers=user_auth["headers"]
-        )
-
-        wallet1_id = wallet1_response.json()["id"]
-        wallet2_id = wallet2_response.json()["id"]
 
         # Create transactions for each wallet
-        transaction1 = {
-            "type": "income",
-            "amount": 500.00,
-            "category": "salary",
-            "wallet_id": wallet1_id,
-        }
-
-        transaction2 = {
-            "type": "expense",
-            "amount": 200.00,
-            "category": "food",
-            "wallet_id": wallet2_id,
-        }
-
-        client.post("/transactions/", json=transaction1, headers=user_auth["headers"])
-        client.post("/transactions/", json=transaction2, headers=user_auth["headers"])
+        _seed_transactions(
+            db,
+            [
+                {
+                    "type": TransactionType.INCOME,
+                    "amount": Decimal("500.00"),
+                    "category": TransactionCategory.SALARY,
+                    "wallet_id": wallet1_id,
+                },
+                {
+                    "type": TransactionType.EXPENSE,
+                    "amount": Decimal("200.00"),
+                    "category": TransactionCategory.FOOD,
+                    "wallet_id": wallet2_id,
+                },
+            ],
+        )
 
         # Get transactions for wallet 1
-        response = client.get(
-            f"/transactions/wallet/{wallet1_id}", headers=user_auth["headers"]
-        )
+        response = await async_client.get(f"/transactions/wallet/{wallet1_id}")
 
         assert response.status_code == 200
         data = response.json()
@@ -459,81 +430,61 @@ class TestTransactions:
             assert transaction["wallet_id"] == wallet1_id
 
     def test_wallet_balance_update_after_transactions(
-        self, client: TestClient, user_auth
+        self, db: Session, user_auth, wallet_factory
     ):
         """Test that wallet balance is properly updated after transactions"""
-        # Create wallet with initial balance
-        wallet_data = {
-            "name": "Balance Test Wallet",
-            "type": "checking",
-            "balance": 1000.00,
-        }
+        user_id = user_auth["user"]["id"]
+        service = TransactionService(db)
 
-        wallet_response = client.post(
-            "/wallets/", json=wallet_data, headers=user_auth["headers"]
+        # Create wallet with initial balance
+        wallet_id = wallet_factory(
+            name="Balance Test Wallet", balance=Decimal("1000.00")
         )
-        wallet_id = wallet_response.json()["id"]
 
         # Create income transaction (+500)
-        income_data = {
-            "type": "income",
-            "amount": 500.00,
-            "category": "salary",
-            "wallet_id": wallet_id,
-        }
-
-        client.post("/transactions/", json=income_data, headers=user_auth["headers"])
-
-        # Check wallet balance
-        wallet_response = client.get(
-            f"/wallets/{wallet_id}", headers=user_auth["headers"]
-        )
-        assert math.isclose(
-            float(wallet_response.json()["balance"]), 1500.00, rel_tol=1e-9
+        service.create_transaction(
+            TransactionCreateDTO(
+                type=TransactionType.INCOME,
+                amount=Decimal("500.00"),
+                category=TransactionCategory.SALARY,
+                wallet_id=wallet_id,
+            ),
+            user_id,
         )
+        assert db.get(Wallet, wallet_id).balance == Decimal("1500.00")
 
         # Create expense transaction (-200)
-        expense_data = {
-            "type": "expense",
-            "amount": 200.00,
-            "category": "food",
-            "wallet_id": wallet_id,
-        }
-
-        client.post("/transactions/", json=expense_data, headers=user_auth["headers"])
-
-        # Check wallet balance again
-        wallet_response = client.get(
-            f"/wallets/{wallet_id}", headers=user_auth["headers"]
-        )
-        assert math.isclose(
-            float(wallet_response.json()["balance"]), 1300.00, rel_tol=1e-9
+        service.create_transaction(
+            TransactionCreateDTO(
+                type=TransactionType.EXPENSE,
+                amount=Decimal("200.00"),
+                category=TransactionCategory.FOOD,
+                wallet_id=wallet_id,
+            ),
+            user_id,
         )
+        assert db.get(Wallet, wallet_id).balance == Decimal("1300.00")
 
-    def test_transaction_operations_unauthorized(self, client: TestClient):
-        """Test transaction operations without authentication"""
-        operations = [
+    @pytest.mark.parametrize(
+        "method,url,data",
+        [
             ("GET", "/transactions/", None),
             (
                 "POST",
                 "/transactions/",
-                {"type": "income", "amount": 100, "category": "salary", "wallet_id": 1},
+                {**_BASE_TRANSACTION, "wallet_id": 1},
             ),
             ("GET", "/transactions/1", None),
             ("PUT", "/transactions/1", {"amount": 150}),
             ("DELETE", "/transactions/1", None),
             ("GET", "/transactions/summary", None),
             ("GET", "/transactions/wallet/1", None),
-        ]
-
-        for method, url, data in operations:
-            if method == "GET":
-                response = client.get(url)
-            elif method == "POST":
-                response = client.post(url, json=data)
-            elif method == "PUT":
-                response = client.put(url, json=data)
-            elif method == "DELETE":
-                response = client.delete(url)
-
-            assert response.status_code == 401
+        ],
+    )
+    async def test_transaction_operations_unauthorized(
+        self, async_client: AsyncClient, method, url, data
+    ):
+        """Test transaction operations without authentication"""
+        response = await async_client.request(method, url, json=data)
+
+        assert response.status_code == 401
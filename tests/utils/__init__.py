@@ -1,5 +1,17 @@
 """Test utilities package"""
 
-from .data_seeder import DataSeeder
+from .assertions import assert_json_contains
+from .data_seeder import (
+    DataSeeder,
+    apply_balance_deltas,
+    commit_staged_rows,
+    stage_rows,
+)
 
-__all__ = ["DataSeeder"]
+__all__ = [
+    "DataSeeder",
+    "apply_balance_deltas",
+    "assert_json_contains",
+    "commit_staged_rows",
+    "stage_rows",
+]
@@ -0,0 +1,17 @@
+"""
+Assertion helpers for checking API responses.
+"""
+
+import json
+
+
+def assert_json_contains(response, field: str, value) -> None:
+    """
+    Assert a top-level ``field: value`` pair is present in a JSON response
+    body, without decoding the body.
+
+    Relies on the compact separators used by FastAPI's JSONResponse.
+    """
+    fragment = json.dumps({field: value}, separators=(",", ":"), ensure_ascii=False)
+    fragment = fragment[1:-1].encode("utf-8")
+    assert fragment in response.content, f"{fragment!r} not in {response.content!r}"
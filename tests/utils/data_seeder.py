@@ -3,22 +3,75 @@ Test data seeder utility for creating test data in the database.
 Similar to auralys_api DataSeeder pattern.
 """
 
+from sqlalchemy import bindparam, update
 from sqlalchemy.orm import Session
 from decimal import Decimal
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Mapping, Optional
 
 from app.db.models.user import User
 from app.db.models.wallet import Wallet
-from app.db.models.refresh_token import RefreshToken
+from app.db.models.debt import Debt
 from app.core.security import hash_password
 
 
+@lru_cache(maxsize=32)
+def _cached_hash(password: str) -> str:
+    """
+    Hash each distinct seeder password once.
+    Test-only: real password hashes must never be cached or share a salt.
+    """
+    return hash_password(password)
+
+
+# Session.info flag telling the test client to commit staged fixture rows
+_PENDING_COMMIT = "pending_commit"
+
+
+def stage_rows(db: Session) -> None:
+    """
+    Flush seeded rows so they get primary keys, deferring the commit.
+    All setup in a test then shares one SAVEPOINT, committed by
+    commit_staged_rows before the first API request.
+    """
+    db.flush()
+    db.info[_PENDING_COMMIT] = True
+
+
+def commit_staged_rows(db: Session) -> None:
+    """Commit rows staged with stage_rows, so the app cannot roll them back"""
+    if db.info.pop(_PENDING_COMMIT, False):
+        db.commit()
+
+
+def apply_balance_deltas(db: Session, deltas: Mapping[int, Decimal]) -> None:
+    """
+    Move each wallet's balance by its delta in one executemany UPDATE, the
+    way the API would after rows are seeded directly into the database.
+    """
+    if not deltas:
+        return
+
+    wallets = Wallet.__table__
+    db.execute(
+        update(wallets)
+        .where(wallets.c.id == bindparam("wallet_id"))
+        .values(balance=wallets.c.balance + bindparam("delta")),
+        [{"wallet_id": wid, "delta": delta} for wid, delta in deltas.items()],
+    )
+
+
 class DataSeeder:
     """Utility class for seeding test data"""
 
     def __init__(self, db: Session):
         self.db = db
 
+    def _stage(self, *instances) -> None:
+        """Flush new rows and let the test client commit them on first request"""
+        self.db.add_all(instances)
+        stage_rows(self.db)
+
     def create_user(
         self,
         name: str = "Test User",
@@ -27,14 +80,16 @@ class DataSeeder:
         role: str = "user",
     ) -> User:
         """Create a test user"""
-        user = User(
-            name=name, email=email, hashed_password=hash_password(password), role=role
-        )
-        self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        user = self._build_user(name, email, password, role)
+        self._stage(user)
         return user
 
+    @staticmethod
+    def _build_user(name: str, email: str, password: str, role: str = "user") -> User:
+        return User(
+            name=name, email=email, hashed_password=_cached_hash(password), role=role
+        )
+
     def create_admin(
         self,
         name: str = "Admin User",
@@ -53,11 +108,30 @@ class DataSeeder:
     ) -> Wallet:
         """Create a test wallet for a user"""
         wallet = Wallet(name=name, type=wallet_type, balance=balance, user_id=user.id)
-        self.db.add(wallet)
-        self.db.commit()
-        self.db.refresh(wallet)
+        self._stage(wallet)
         return wallet
 
+    def create_debt(
+        self,
+        wallet_id: int,
+        amount: Decimal = Decimal("100.00"),
+        borrower: str = "Test Borrower",
+        debt_type: str = "owed",
+        description: Optional[str] = None,
+        is_paid: bool = False,
+    ) -> Debt:
+        """Create a test debt on a wallet"""
+        debt = Debt(
+            amount=amount,
+            borrower=borrower,
+            type=debt_type,
+            description=description,
+            is_paid=is_paid,
+            wallet_id=wallet_id,
+        )
+        self._stage(debt)
+        return debt
+
     def create_multiple_wallets(
         self, user: User, wallets_data: Optional[List[dict]] = None
     ) -> List[Wallet]:
@@ -78,17 +152,22 @@ class DataSeeder:
                 {"name": "Credit Card", "type": "credit", "balance": Decimal("0.00")},
             ]
 
-        wallets = []
-        for wallet_data in wallets_data:
-            wallet = self.create_wallet(
-                user=user,
+        wallets = self._build_wallets(user, wallets_data)
+        self._stage(*wallets)
+        return wallets
+
+    @staticmethod
+    def _build_wallets(user: User, wallets_data: List[dict]) -> List[Wallet]:
+        # Link through the relationship so users and wallets can share a flush
+        return [
+            Wallet(
                 name=wallet_data["name"],
-                wallet_type=wallet_data["type"],
+                type=wallet_data["type"],
                 balance=wallet_data["balance"],
+                user=user,
             )
-            wallets.append(wallet)
-
-        return wallets
+            for wallet_data in wallets_data
+        ]
 
     def create_user_with_wallets(
         self,
@@ -106,12 +185,12 @@ class DataSeeder:
 
     def create_complete_scenario(self) -> dict:
         """Create a complete test scenario with multiple users and wallets"""
-        # Create regular user with wallets
-        regular_user = self.create_user(
+        # Regular user with wallets
+        regular_user = self._build_user(
             name="John Doe", email="john@example.com", password="password123"
         )
 
-        regular_wallets = self.create_multiple_wallets(
+        regular_wallets = self._build_wallets(
             regular_user,
             [
                 {
@@ -128,10 +207,15 @@ class DataSeeder:
             ],
         )
 
-        # Create admin user
-        admin_user = self.create_admin(name="Admin Smith", email="admin@example.com")
+        # Admin user
+        admin_user = self._build_user(
+            name="Admin Smith",
+            email="admin@example.com",
+            password="adminpassword123",
+            role="admin",
+        )
 
-        admin_wallets = self.create_multiple_wallets(
+        admin_wallets = self._build_wallets(
             admin_user,
             [
                 {
@@ -142,12 +226,12 @@ class DataSeeder:
             ],
         )
 
-        # Create user with credit wallet
-        credit_user = self.create_user(
+        # User with credit wallet
+        credit_user = self._build_user(
             name="Jane Credit", email="jane@example.com", password="password123"
         )
 
-        credit_wallets = self.create_multiple_wallets(
+        credit_wallets = self._build_wallets(
             credit_user,
             [
                 {
@@ -163,6 +247,16 @@ class DataSeeder:
             ],
         )
 
+        # One flush inserts every user, then every wallet
+        self._stage(
+            regular_user,
+            admin_user,
+            credit_user,
+            *regular_wallets,
+            *admin_wallets,
+            *credit_wallets,
+        )
+
         return {
             "regular_user": regular_user,
             "regular_wallets": regular_wallets,
@@ -171,10 +265,3 @@ class DataSeeder:
             "credit_user": credit_user,
             "credit_wallets": credit_wallets,
         }
-
-    def cleanup_all(self):
-        """Clean up all test data"""
-        self.db.query(RefreshToken).delete()
-        self.db.query(Wallet).delete()
-        self.db.query(User).delete()
-        self.db.commit()